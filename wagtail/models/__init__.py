@@ -1414,6 +1414,10 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         # always check if this page is a site root, even if it's new.
         if self.is_site_root():
             Site.clear_site_root_paths_cache()
+            # The cached sites hold a copy of their root page
+            Site.clear_sites_cache(
+                self.sites_rooted_here.values_list("hostname", flat=True)
+            )
 
         # Log
         if is_new:
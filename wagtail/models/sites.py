@@ -4,66 +4,57 @@ from django.apps import apps
 from django.conf import settings
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models import Case, IntegerField, Q, When
+from django.db import models, transaction
+from django.db.models import BooleanField, ExpressionWrapper, Q
 from django.db.models.functions import Lower
 from django.http.request import split_domain_port
 from django.utils.translation import gettext_lazy as _
 
-MATCH_HOSTNAME_PORT = 0
-MATCH_HOSTNAME_DEFAULT = 1
-MATCH_DEFAULT = 2
-MATCH_HOSTNAME = 3
+from wagtail.coreutils import safe_md5
+
+SITES_CACHE_KEY_PREFIX = "wagtail_sites"
+DEFAULT_SITE_CACHE_KEY = "wagtail_default_site"
+# Increase the cache version whenever the fields of the Site or Page models change
+SITES_CACHE_VERSION = 1
+
+
+def get_sites_cache_key(hostname):
+    # Hash the hostname to keep the key short and safe for every cache backend
+    return "%s:%s" % (
+        SITES_CACHE_KEY_PREFIX,
+        safe_md5(hostname.encode(), usedforsecurity=False).hexdigest(),
+    )
 
 
 def get_site_for_hostname(hostname, port):
     """Return the wagtailcore.Site object for the given hostname and port."""
     Site = apps.get_model("wagtailcore.Site")
 
-    sites = list(
-        Site.objects.annotate(
-            match=Case(
-                # annotate the results by best choice descending
-                # put exact hostname+port match first
-                When(hostname=hostname, port=port, then=MATCH_HOSTNAME_PORT),
-                # then put hostname+default (better than just hostname or just default)
-                When(
-                    hostname=hostname, is_default_site=True, then=MATCH_HOSTNAME_DEFAULT
-                ),
-                # then match default with different hostname. there is only ever
-                # one default, so order it above (possibly multiple) hostname
-                # matches so we can use sites[0] below to access it
-                When(is_default_site=True, then=MATCH_DEFAULT),
-                # because of the filter below, if it's not default then its a hostname match
-                default=MATCH_HOSTNAME,
-                output_field=IntegerField(),
-            )
-        )
-        .filter(Q(hostname=hostname) | Q(is_default_site=True))
-        .order_by("match")
-        .select_related("root_page")
-    )
+    hostname_matches, default_site = Site.get_sites_for_hostname(hostname)
+    for site in hostname_matches:
+        # the port may be passed as a string, e.g. from request.get_port()
+        if str(site.port) == str(port):
+            # an exact hostname+port match always wins
+            return site
 
-    if sites:
-        # if there's a unique match or hostname (with port or default) match
-        if len(sites) == 1 or sites[0].match in (
-            MATCH_HOSTNAME_PORT,
-            MATCH_HOSTNAME_DEFAULT,
-        ):
-            return sites[0]
+    if default_site is not None and default_site in hostname_matches:
+        # hostname+default is better than just hostname or just default
+        return default_site
 
-        # if there is a default match with a different hostname, see if
-        # there are many hostname matches. if only 1 then use that instead
-        # otherwise we use the default
-        if sites[0].match == MATCH_DEFAULT:
-            return sites[len(sites) == 2]
+    if len(hostname_matches) == 1:
+        # a unique hostname match is preferred over a default with a different hostname
+        return hostname_matches[0]
+
+    if default_site is not None:
+        # otherwise use the default, even if there are many hostname matches
+        return default_site
 
     raise Site.DoesNotExist()
 
 
 class SiteManager(models.Manager):
     def get_queryset(self):
-        return super(SiteManager, self).get_queryset().order_by(Lower("hostname"))
+        return super().get_queryset().order_by(Lower("hostname"))
 
     def get_by_natural_key(self, hostname, port):
         return self.get(hostname=hostname, port=port)
@@ -264,6 +255,72 @@ class Site(models.Model):
 
         return result
 
+    @staticmethod
+    def get_sites_for_hostname(hostname):
+        """
+        Return a `(hostname_matches, default_site)` tuple of the sites that
+        may respond to requests for the given hostname: the list of sites the
+        database matches to that hostname, and the default site, or None.
+
+        The sites are cached per hostname, with the default site cached
+        separately, and have their `root_page` preloaded so that routing a
+        request does not need to query the database.
+        """
+        hostname_key = get_sites_cache_key(hostname)
+        version = SITES_CACHE_VERSION
+        cached = cache.get_many([hostname_key, DEFAULT_SITE_CACHE_KEY], version=version)
+
+        if len(cached) < 2:
+            # Leave hostname matching to the database, so that it follows the
+            # collation of the hostname column
+            sites = list(
+                Site.objects.filter(Q(hostname=hostname) | Q(is_default_site=True))
+                .annotate(
+                    matches_hostname=ExpressionWrapper(
+                        Q(hostname=hostname), output_field=BooleanField()
+                    )
+                )
+                .select_related("root_page")
+            )
+            result = {
+                hostname_key: [site for site in sites if site.matches_hostname],
+                DEFAULT_SITE_CACHE_KEY: [
+                    site for site in sites if site.is_default_site
+                ],
+            }
+            cache.set_many(
+                {key: value for key, value in result.items() if key not in cached},
+                3600,
+                version=version,
+            )
+            cached = result
+
+        default_sites = cached[DEFAULT_SITE_CACHE_KEY]
+        return cached[hostname_key], (default_sites[0] if default_sites else None)
+
+    @staticmethod
+    def clear_sites_cache(hostnames=()):
+        """
+        Clear the cached sites for the given hostnames, along with the cached
+        default site.
+
+        The cache is cleared straight away and again once the current
+        transaction commits, as a concurrent request may cache the old records
+        again before then.
+        """
+        keys = {DEFAULT_SITE_CACHE_KEY}
+        for hostname in hostnames:
+            # Requests are looked up by lowercased hostname, which the database
+            # may match to a hostname stored in a different case
+            keys.add(get_sites_cache_key(hostname))
+            keys.add(get_sites_cache_key(hostname.lower()))
+        keys = list(keys)
+
+        cache.delete_many(keys, version=SITES_CACHE_VERSION)
+        transaction.on_commit(
+            lambda: cache.delete_many(keys, version=SITES_CACHE_VERSION)
+        )
+
     @staticmethod
     def clear_site_root_paths_cache():
         cache.delete(SITE_ROOT_PATHS_CACHE_KEY, version=SITE_ROOT_PATHS_CACHE_VERSION)
@@ -9,6 +9,7 @@ from django.db.models.signals import (
     post_save,
     pre_delete,
     pre_migrate,
+    pre_save,
 )
 from modelcluster.fields import ParentalKey
 
@@ -18,12 +19,22 @@ from wagtail.models import Locale, Page, ReferenceIndex, Site
 logger = logging.getLogger("wagtail")
 
 
-# Clear the wagtail_site_root_paths from the cache whenever Site records are updated.
+# Clear the cached sites and wagtail_site_root_paths from the cache whenever Site records are updated.
+def pre_save_site_signal_handler(instance, **kwargs):
+    # The site may be moving away from its previous hostname
+    if instance.pk is not None:
+        Site.clear_sites_cache(
+            Site.objects.filter(pk=instance.pk).values_list("hostname", flat=True)
+        )
+
+
 def post_save_site_signal_handler(instance, update_fields=None, **kwargs):
+    Site.clear_sites_cache([instance.hostname])
     Site.clear_site_root_paths_cache()
 
 
 def post_delete_site_signal_handler(instance, **kwargs):
+    Site.clear_sites_cache([instance.hostname])
     Site.clear_site_root_paths_cache()
 
 
@@ -42,6 +53,15 @@ def reset_locales_display_names_cache(sender, instance, **kwargs):
     get_locales_display_names.cache_clear()
 
 
+# The cached site root paths include the language code of each root page's locale
+def post_save_locale_signal_handler(instance, update_fields=None, **kwargs):
+    Site.clear_site_root_paths_cache()
+
+
+def post_delete_locale_signal_handler(instance, **kwargs):
+    Site.clear_site_root_paths_cache()
+
+
 reference_index_auto_update_disabled = Local()
 
 
@@ -120,6 +140,7 @@ def disconnect_reference_index_signal_handlers(**kwargs):
 
 
 def register_signal_handlers():
+    pre_save.connect(pre_save_site_signal_handler, sender=Site)
     post_save.connect(post_save_site_signal_handler, sender=Site)
     post_delete.connect(post_delete_site_signal_handler, sender=Site)
 
@@ -128,6 +149,8 @@ def register_signal_handlers():
 
     post_save.connect(reset_locales_display_names_cache, sender=Locale)
     post_delete.connect(reset_locales_display_names_cache, sender=Locale)
+    post_save.connect(post_save_locale_signal_handler, sender=Locale)
+    post_delete.connect(post_delete_locale_signal_handler, sender=Locale)
 
     # Disconnect reference index signals while migrations are running
     # (we don't want to log references in migrations as the ReferenceIndex model might not exist)
@@ -1,5 +1,7 @@
 from django.contrib.auth.models import Permission
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from wagtail.admin.admin_url_finder import AdminURLFinder
@@ -26,6 +28,18 @@ class TestSiteIndexView(WagtailTestUtils, TestCase):
             response = self.get({"p": page})
             self.assertEqual(response.status_code, 200)
 
+    def test_root_pages_are_not_queried_per_site(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.get()
+        num_queries = len(queries)
+
+        for hostname in ["alfa.com", "bravo.com", "charly.com"]:
+            Site.objects.create(hostname=hostname, root_page=self.home_page)
+
+        with self.assertNumQueries(num_queries):
+            response = self.get()
+        self.assertContains(response, "charly.com")
+
 
 class TestSiteCreateView(WagtailTestUtils, TestCase):
     def setUp(self):
@@ -28,6 +28,10 @@ class IndexView(generic.IndexView):
         ),
     ]
 
+    def get_base_queryset(self):
+        # The root_page column displays each site's root page
+        return super().get_base_queryset().select_related("root_page")
+
 
 class CreateView(generic.CreateView):
     page_title = _("Add site")
@@ -1,8 +1,18 @@
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import connection, models
+from django.db.models.lookups import IExact
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext, register_lookup
 
 from wagtail.coreutils import get_dummy_request
 from wagtail.models import Page, Site
+from wagtail.models.sites import (
+    DEFAULT_SITE_CACHE_KEY,
+    SITES_CACHE_VERSION,
+    get_site_for_hostname,
+    get_sites_cache_key,
+)
 
 
 class TestSiteNaturalKey(TestCase):
@@ -151,6 +161,111 @@ class TestFindSiteForRequest(TestCase):
         request.META.update({"SERVER_NAME": "[::1]", "SERVER_PORT": 80})
         self.assertEqual(Site.find_for_request(request), self.default_site)
 
+    def test_sites_are_cached(self):
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), self.site)
+
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        with CaptureQueriesContext(connection) as queries:
+            site = Site.find_for_request(request)
+            self.assertEqual(site, self.site)
+            self.assertEqual(site.root_page, self.site.root_page)
+        self.assertFalse(
+            any(
+                Site._meta.db_table in query["sql"]
+                or Page._meta.db_table in query["sql"]
+                for query in queries
+            )
+        )
+
+    def test_cache_cleared_on_root_page_save(self):
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), self.site)
+
+        root_page = self.site.root_page
+        root_page.title = "New title"
+        root_page.save()
+
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request).root_page.title, "New title")
+
+    def test_cache_cleared_on_site_save(self):
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), self.site)
+
+        self.site.hostname = "other.com"
+        self.site.save()
+
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), self.default_site)
+
+    def test_cache_cleared_on_commit(self):
+        old_sites = Site.get_sites_for_hostname("example.com")
+
+        self.site.hostname = "other.com"
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.site.save()
+
+            # A concurrent request caches the old records before the commit
+            cache.set_many(
+                {
+                    get_sites_cache_key("example.com"): old_sites[0],
+                    DEFAULT_SITE_CACHE_KEY: [old_sites[1]],
+                },
+                version=SITES_CACHE_VERSION,
+            )
+            request = get_dummy_request()
+            request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+            self.assertEqual(Site.find_for_request(request).hostname, "example.com")
+
+        self.assertTrue(callbacks)
+        for callback in callbacks:
+            callback()
+
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), self.default_site)
+
+    def test_cache_cleared_on_site_delete(self):
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), self.site)
+
+        self.site.delete()
+
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+        self.assertEqual(Site.find_for_request(request), self.default_site)
+
+    def test_ambiguous_hostname_without_default_site(self):
+        self.default_site.is_default_site = False
+        self.default_site.save()
+        Site.objects.create(
+            hostname="example.com", port=8080, root_page=Page.objects.get(pk=2)
+        )
+
+        # An exact hostname+port match is still found
+        self.assertEqual(get_site_for_hostname("example.com", 80), self.site)
+
+        # But with several hostname matches and no default there is no site
+        with self.assertRaises(Site.DoesNotExist):
+            get_site_for_hostname("example.com", 8000)
+
+    def test_hostname_matched_by_database_collation(self):
+        Site.objects.filter(pk=self.site.pk).update(hostname="Example.com")
+
+        # Emulate a case-insensitive collation, as used by MySQL
+        with register_lookup(models.CharField, IExact, lookup_name="exact"):
+            request = get_dummy_request()
+            request.META.update({"HTTP_HOST": "example.com", "SERVER_PORT": 80})
+            self.assertEqual(Site.find_for_request(request), self.site)
+
 
 class TestDefaultSite(TestCase):
     def test_create_default_site(self):
@@ -216,3 +331,12 @@ class TestGetSiteRootPaths(TestCase):
         # Followed by entries for others in 'host' alphabetical order
         self.assertEqual(result[1][0], self.abc_site.id)
         self.assertEqual(result[2][0], self.def_site.id)
+
+    def test_cache_cleared_on_locale_save(self):
+        self.assertEqual(Site.get_site_root_paths()[0].language_code, "en")
+
+        locale = self.default_site.root_page.locale
+        locale.language_code = "fr"
+        locale.save()
+
+        self.assertEqual(Site.get_site_root_paths()[0].language_code, "fr")
@@ -104,6 +104,11 @@ class TestPageUrlTags(TestCase):
         )
         self.assertIn('<a href="/events/">Events</a>', result)
 
+    # Override CACHES so we don't generate any cache-related SQL queries (tests use DatabaseCache
+    # otherwise) and so cache.get will always return None.
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    )
     def test_pageurl_caches(self):
         page = Page.objects.get(url_path="/home/events/")
         tpl = template.Template(
@@ -112,7 +117,7 @@ class TestPageUrlTags(TestCase):
 
         request = get_dummy_request()
 
-        with self.assertNumQueries(8):
+        with self.assertNumQueries(2):
             result = tpl.render(template.Context({"page": page, "request": request}))
         self.assertIn('<a href="/events/">Events</a>', result)
 
@@ -120,7 +125,10 @@ class TestPageUrlTags(TestCase):
             result = tpl.render(template.Context({"page": page, "request": request}))
         self.assertIn('<a href="/events/">Events</a>', result)
 
-    @override_settings(ALLOWED_HOSTS=["testserver", "localhost", "unknown.example.com"])
+    @override_settings(
+        ALLOWED_HOSTS=["testserver", "localhost", "unknown.example.com"],
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}},
+    )
     def test_pageurl_with_unknown_site(self):
         page = Page.objects.get(url_path="/home/events/")
         tpl = template.Template(
@@ -130,7 +138,7 @@ class TestPageUrlTags(TestCase):
         # 'request' object in context, but site is None
         request = get_dummy_request()
         request.META["HTTP_HOST"] = "unknown.example.com"
-        with self.assertNumQueries(8):
+        with self.assertNumQueries(2):
             result = tpl.render(template.Context({"page": page, "request": request}))
         self.assertIn('<a href="/events/">Events</a>', result)
 
@@ -188,6 +196,9 @@ class TestPageUrlTags(TestCase):
         url = slugurl(slug="christmas", context=template.Context({"request": request}))
         self.assertEqual(url, "http://localhost/events/christmas/")
 
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    )
     def test_slugurl_without_request_in_context(self):
         # no 'request' object in context
         result = slugurl(template.Context({}), "events")
@@ -1,7 +1,7 @@
 from django.contrib.auth import get_user_model
 
 from wagtail.admin.views.bulk_action import BulkAction
-from wagtail.users.views.users import get_users_filter_query
+from wagtail.users.views.users import get_model_field_names, get_users_filter_query
 
 
 class UserBulkAction(BulkAction):
@@ -11,7 +11,7 @@ class UserBulkAction(BulkAction):
         listing_objects = self.model.objects.all().values_list("pk", flat=True)
         if "q" in self.request.GET:
             q = self.request.GET.get("q")
-            model_fields = [f.name for f in self.model._meta.get_fields()]
+            model_fields = get_model_field_names(self.model)
             conditions = get_users_filter_query(q, model_fields)
 
             listing_objects = listing_objects.filter(conditions)
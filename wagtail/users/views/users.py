@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.conf import settings
 from django.contrib.auth import get_user_model, update_session_auth_hash
 from django.contrib.auth.models import Group
@@ -45,6 +47,15 @@ def get_user_edit_form():
         return UserEditForm
 
 
+@lru_cache(maxsize=None)
+def get_model_field_names(model):
+    """
+    Return the names of all fields on the given user model, for checking
+    which fields are available to filter and order users by.
+    """
+    return frozenset(field.name for field in model._meta.get_fields())
+
+
 def get_users_filter_query(q, model_fields):
     conditions = Q()
 
@@ -87,7 +98,7 @@ class Index(IndexView):
         setattr(self, "template_name", self.get_template())
         self.group = get_object_or_404(Group, id=args[0]) if args else None
         self.group_filter = Q(groups=self.group) if self.group else Q()
-        self.model_fields = [f.name for f in User._meta.get_fields()]
+        self.model_fields = get_model_field_names(User)
 
     def get_valid_orderings(self):
         return ["name", "username"]
@@ -1,4 +1,3 @@
-import io
 import json
 import os
 import subprocess
@@ -30,19 +29,19 @@ class assets_mixin:
         Writes the current Wagtail version number into package.json
         """
         path = os.path.join(".", "client", "package.json")
-        input_file = io.open(path, "r")
 
         try:
-            package = json.loads(input_file.read().decode("utf-8"))
+            with open(path, "rb") as f:
+                package = json.load(f)
         except (ValueError) as e:
-            print("Unable to read " + path + " " + e)  # noqa
+            print("Unable to read " + path + " " + str(e))  # noqa
             raise SystemExit(1)
 
         package["version"] = __semver__
 
         try:
-            with io.open(path, "w", encoding="utf-8") as f:
-                f.write(str(json.dumps(package, indent=2, ensure_ascii=False)))
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(package, f, indent=2, ensure_ascii=False)
         except (IOError) as e:
             print("Error setting the version for front-end assets: " + str(e))  # noqa
             raise SystemExit(1)